@@ -7,8 +7,7 @@ from rich.console import Console
 from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.panel import Panel
 import dataclasses
-import itertools
-import copy
+from collections.abc import Iterable
 
 # Custom console for rich highlighting/precise control
 console = Console(highlight=False)
@@ -17,13 +16,29 @@ console = Console(highlight=False)
 # -----------------------------------------------------------------
 # Configuration
 # -----------------------------------------------------------------
+# Every declared configuration, by name
+_configs: dict[str, CluedoConfiguration] = {}
+
+
 class CluedoConfiguration:
     """
     Represents a configuration for the Cluedo game, e.g. Harry Potter or Standard
     defines lists of weapons, suspects and locations.
     """
 
-    configs = []
+    __slots__ = (
+        "name",
+        "weapons",
+        "suspects",
+        "locations",
+        "cards",
+        "card_index",
+        "card_bits",
+        "all_mask",
+        "suspect_mask",
+        "weapon_mask",
+        "location_mask",
+    )
 
     def __init__(
         self, name: str, weapons: list[str], suspects: list[str], locations: list[str]
@@ -32,23 +47,42 @@ class CluedoConfiguration:
         self.weapons: list[str] = weapons
         self.suspects: list[str] = suspects
         self.locations: list[str] = locations
-        CluedoConfiguration.configs.append(self)
+        self.cards: tuple[str, ...] = tuple(suspects + locations + weapons)
+        # Each card gets a single bit so card sets can be stored as ints
+        self.card_index: dict[str, int] = {c: i for i, c in enumerate(self.cards)}
+        self.card_bits: dict[str, int] = {c: 1 << i for c, i in self.card_index.items()}
+        self.all_mask: int = (1 << len(self.card_bits)) - 1
+        self.suspect_mask: int = self.mask_of(suspects)
+        self.weapon_mask: int = self.mask_of(weapons)
+        self.location_mask: int = self.mask_of(locations)
+        _configs[name] = self
 
     @classmethod
     def get_by_name(cls, name: str) -> CluedoConfiguration:
-        for config in cls.configs:
-            if config.name == name:
-                return config
-        raise ValueError(f"Unknown configuration: {name}")
+        try:
+            return _configs[name]
+        except KeyError:
+            raise ValueError(f"Unknown configuration: {name}") from None
 
     @classmethod
     def known_configurations(cls) -> list[CluedoConfiguration]:
         """Returns any declared configurations"""
-        return cls.configs
+        return list(_configs.values())
 
-    @property
-    def cards(self):
-        return self.suspects + self.locations + self.weapons
+    def mask_of(self, cards: Iterable[str]) -> int:
+        """Returns the bitmask for a collection of card names"""
+        mask = 0
+        for card in cards:
+            mask |= self.card_bits[card]
+        return mask
+
+    def cards_of(self, mask: int) -> list[str]:
+        """Returns the card names set in a bitmask, in configuration order"""
+        return [c for c, b in self.card_bits.items() if mask & b]
+
+    def card_at(self, bit: int) -> str:
+        """Returns the card name for a single-bit mask"""
+        return self.cards[bit.bit_length() - 1]
 
 
 STANDARD = CluedoConfiguration(
@@ -96,7 +130,7 @@ HARRY_POTTER = CluedoConfiguration(
 # -----------------------------------------------------------------
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Suggestion:
     """Represents a suggestion that someone could make
     for example 'Rev Green in the Ballroom with the wrench'
@@ -105,17 +139,20 @@ class Suggestion:
     suspect: str
     weapon: str
     location: str
+    _cards: frozenset[str] = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Built once, the suggestion can't change
+        object.__setattr__(
+            self, "_cards", frozenset((self.suspect, self.weapon, self.location))
+        )
 
     def __str__(self) -> str:
         return f"{self.suspect} with the {self.weapon} in the {self.location}"
 
     @property
-    def cards(self) -> set[str]:
-        s = set()
-        s.add(self.weapon)
-        s.add(self.suspect)
-        s.add(self.location)
-        return s
+    def cards(self) -> frozenset[str]:
+        return self._cards
 
 
 # -----------------------------------------------------------------
@@ -123,6 +160,15 @@ class Suggestion:
 # -----------------------------------------------------------------
 class Player:
     names = []
+    __slots__ = (
+        "name",
+        "position",
+        "config",
+        "has_mask",
+        "not_mask",
+        "max_cards",
+        "version",
+    )
 
     def __init__(
         self, name: str, position: int, config: CluedoConfiguration, max_cards: int
@@ -131,14 +177,16 @@ class Player:
         self.register_name(name)
         self.position = position
         self.config = config
-        # set of cards that the player definitely does have
-        self.cards = set()
-        # set of cards that the player definitely does not have
-        self.not_cards = set()
+        # bitmask of cards that the player definitely does have
+        self.has_mask: int = 0
+        # bitmask of cards that the player definitely does not have
+        self.not_mask: int = 0
         self.max_cards = max_cards
+        # bumped whenever the masks change, so cached deductions can be reused
+        self.version: int = 0
 
     def __str__(self) -> str:
-        return f"Summary of {self.name}\nHand: {self.cards}"
+        return f"Summary of {self.name}\nHand: {self.config.cards_of(self.has_mask)}"
 
     @classmethod
     def register_name(cls, name):
@@ -146,42 +194,40 @@ class Player:
 
     def add_card(self, card):
         """Attempts to add a card to the players hand. If it is not a valid card, raise ValueError"""
-        if card not in self.config.cards:
+        if card not in self.config.card_bits:
             raise ValueError("Not a valid card")
-        self.cards.add(card)
+        bit = self.config.card_bits[card]
+        if not self.has_mask & bit:
+            self.has_mask |= bit
+            self.version += 1
 
     def mark_not_card(self, card):
-        self.not_cards.add(card)
+        bit = self.config.card_bits[card]
+        if not self.not_mask & bit:
+            self.not_mask |= bit
+            self.version += 1
 
     def has_card(self, card: str) -> bool:
         """Check if player has a specific card"""
-        return card in self.cards
-
-    def might_have_card(self, card: str) -> bool:
-        """Check if player might have this card (unknown)"""
-        return card not in self.cards and card not in self.not_cards
-
-    def can_show_any(self, suggestion: Suggestion):
-        """Check if the player can show any cards for a specific suggestion"""
-        return any(card in self.cards for card in suggestion.cards)
+        return bool(self.has_mask & self.config.card_bits[card])
 
     def respond_to_suggestion(self, suggestion: Suggestion) -> str | None: ...
 
     @property
     def is_full(self) -> bool:
         """True if this player has all their cards."""
-        return len(self.cards) == self.max_cards
+        return self.has_mask.bit_count() == self.max_cards
 
     @property
     def cards_remaining(self) -> int:
         """How many more cards this player could have."""
-        return self.max_cards - len(self.cards)
+        return self.max_cards - self.has_mask.bit_count()
 
 
 # -----------------------------------------------------------------
 # Logic
 # -----------------------------------------------------------------
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Constraint:
     """
     Records that a player showed one card from a set, but we don't know which.
@@ -189,22 +235,45 @@ class Constraint:
     """
 
     player: Player
-    possible_cards: frozenset[str]
+    possible_mask: int
+    # player.version and the owned cards when this constraint was last narrowed
+    _cached_version: int = dataclasses.field(default=-1, init=False, repr=False)
+    _cached_owned: int = dataclasses.field(default=0, init=False, repr=False)
 
-    def narrow(self) -> Constraint:
-        """Return a new constraint with cards the player is known not to have removed."""
-        still_possible = frozenset(
-            c for c in self.possible_cards if self.player.might_have_card(c)
+    def narrow(self, owned: int = 0) -> Constraint:
+        """
+        Return a new constraint with cards the player is known not to have removed,
+        along with any cards in owned (held by someone)
+        """
+        player = self.player
+        narrowed = Constraint(
+            player, self.possible_mask & ~(player.has_mask | player.not_mask | owned)
         )
-        return Constraint(self.player, still_possible)
+        narrowed._cached_version = player.version
+        narrowed._cached_owned = owned
+        return narrowed
 
     @property
     def resolved(self) -> bool:
-        return len(self.possible_cards) == 1
+        m = self.possible_mask
+        return m != 0 and m & (m - 1) == 0
 
     @property
     def impossible(self) -> bool:
-        return len(self.possible_cards) == 0
+        return self.possible_mask == 0
+
+
+def _owner_masks(possibles: list[int]) -> tuple[int, int]:
+    """
+    Given each player's mask of cards they might have, returns a mask of cards at
+    least one player could have and a mask of cards more than one player could have
+    """
+    could_have = 0
+    multi = 0
+    for possible in possibles:
+        multi |= could_have & possible
+        could_have |= possible
+    return could_have, multi
 
 
 class KnowledgeBase:
@@ -212,66 +281,103 @@ class KnowledgeBase:
 
     def __init__(self, players: list[Player], config: CluedoConfiguration) -> None:
         self.players = players
-        self.possibilities = copy.deepcopy(config)
-        self.unknown_cards: set[str] = set(config.cards)
+        # The configuration is never modified, so it is shared rather than copied
+        self.possibilities = config
+        self._card_type: dict[str, str] = (
+            {c: "suspect" for c in config.suspects}
+            | {c: "weapon" for c in config.weapons}
+            | {c: "location" for c in config.locations}
+        )
+        self.unknown_mask: int = config.all_mask
+        # Cards some player is known to hold, so nobody else can hold them.
+        # Kept here rather than in every other player's not_mask
+        self._owned_mask: int = 0
         self.constraints: list[Constraint] = []
+        # Set when new knowledge might narrow a constraint
+        self._constraints_dirty: bool = False
         self.solution_possibilities: dict[str, set[str]] = {
             "suspect": set(config.suspects),
             "weapon": set(config.weapons),
             "location": set(config.locations),
         }
+        # Worklist for deduce(): cards, solution slots and players that new
+        # knowledge has touched since they were last examined
+        self._dirty_cards: int = config.all_mask
+        self._dirty_slots: set[str] = set(self.solution_possibilities)
+        self._dirty_players: set[Player] = set(players)
 
     @property
     def num_players(self) -> int:
         return len(self.players)
 
+    def _possible_mask(self, player: Player) -> int:
+        """Cards a player might have, given what is known about everyone"""
+        known = player.has_mask | player.not_mask | self._owned_mask
+        return ~known & self.possibilities.all_mask
+
+    def might_have_card(self, player: Player, card: str) -> bool:
+        """Check if a player might have this card (not known either way)"""
+        return bool(self._possible_mask(player) & self.possibilities.card_bits[card])
+
     def get_card_type(self, card: str) -> str:
-        if card in self.possibilities.suspects:
-            return "suspect"
-        elif card in self.possibilities.weapons:
-            return "weapon"
-        elif card in self.possibilities.locations:
-            return "location"
-        raise ValueError(f"Unknown card: {card}")
+        try:
+            return self._card_type[card]
+        except KeyError:
+            raise ValueError(f"Unknown card: {card}") from None
 
     def record_has_card(self, player: Player, card: str):
         """Record that a specific player definitely has a card"""
-        if card in player.cards:
+        bit = self.possibilities.card_bits.get(card, 0)
+        if player.has_mask & bit:
             return
 
         player.add_card(card)
-        # Cannot be the solution
-        self.unknown_cards.discard(card)
-
-        for i, other in enumerate(self.players):
-            if other != player:
-                other.mark_not_card(card)
+        # Cannot be the solution, or in anyone else's hand
+        self.unknown_mask &= ~bit
+        self._owned_mask |= bit
+        self._constraints_dirty = True
+        # Fewer unknowns can fill anyone's hand
+        self._dirty_players.update(self.players)
 
         card_type = self.get_card_type(card)
-        self.solution_possibilities[card_type].discard(card)
+        possible = self.solution_possibilities[card_type]
+        if card in possible:
+            possible.discard(card)
+            self._dirty_slots.add(card_type)
 
     def record_does_not_have(self, player: Player, card: str):
         """Records that a player does definitely not have a card"""
+        bit = self.possibilities.card_bits[card]
+        if player.not_mask & bit:
+            return
         player.mark_not_card(card)
-
-    def record_showed_one_of(self, player: Player, possible_cards: set[str]):
+        self._constraints_dirty = True
+        self._dirty_cards |= bit
+        self._dirty_players.add(player)
+
+    def _record_solution(self, card_type: str, card: str):
+        """Record that a card is in the solution"""
+        self.solution_possibilities[card_type] = {card}
+        self.unknown_mask &= ~self.possibilities.card_bits[card]
+        self._dirty_slots.add(card_type)
+        self._dirty_players.update(self.players)
+
+    def record_showed_one_of(self, player: Player, possible_cards: Iterable[str]):
         """
         Record that a player showed one card from a set (but we do not know which).
         Immediately resolves if only one card is still possible
         """
-        already_known = possible_cards & player.cards
-
-        unknown_subset = frozenset(
-            c for c in possible_cards if player.might_have_card(c)
-        )
-        if len(unknown_subset) == 0:
+        suggested = self.possibilities.mask_of(possible_cards)
+        unknown_subset = suggested & self._possible_mask(player)
+        if unknown_subset == 0:
             pass
-        elif len(unknown_subset) == 1:
+        elif unknown_subset & (unknown_subset - 1) == 0:
             # Only one card they could have shown. Must be it
-            self.record_has_card(player, next(iter(unknown_subset)))
+            self.record_has_card(player, self.possibilities.card_at(unknown_subset))
         else:
             # Save for later!
             self.constraints.append(Constraint(player, unknown_subset))
+            self._constraints_dirty = True
 
     def record_no_one_showed(
         self, suggestion: Suggestion, your_player: Player, suggesting_player: Player
@@ -281,21 +387,32 @@ class KnowledgeBase:
         other players hand must be in the solution
         """
         if suggesting_player == your_player:
-            for card in suggestion.cards:
-                if card not in your_player.cards and card in self.unknown_cards:
-                    card_type = self.get_card_type(card)
+            hand = your_player.has_mask
+            card_bits = self.possibilities.card_bits
+            # Each field of the suggestion already tells us its card type
+            for card_type, card in (
+                ("suspect", suggestion.suspect),
+                ("weapon", suggestion.weapon),
+                ("location", suggestion.location),
+            ):
+                bit = card_bits[card]
+                if not hand & bit and self.unknown_mask & bit:
                     console.print(f"[bold green]{card} must be in the solution![/]")
-                    self.solution_possibilities[card_type] = {card}
-                    self.unknown_cards.discard(card)
+                    self._record_solution(card_type, card)
 
     def deduce(self) -> bool:
         """
-        Runs all detection strategies
+        Runs all detection strategies until the worklist is empty.
+        Each strategy only looks at what new knowledge has touched
         return True if new information was discovered
         """
         overal_changed = False
-        changed = True
-        while changed:
+        while (
+            self._dirty_cards
+            or self._dirty_slots
+            or self._constraints_dirty
+            or self._dirty_players
+        ):
             changed = False
             changed |= self._deduce_unique_owner()
             changed |= self._deduce_solution_cards()
@@ -310,25 +427,41 @@ class KnowledgeBase:
         """If only one player could possibly hold a card they must have it.
         if no player could have it it must be in the solution
         """
+        unknown = self.unknown_mask & self._dirty_cards
+        self._dirty_cards = 0
+        if not unknown:
+            return False
+
         changed = False
-        for card in list(self.unknown_cards):
-            possible_owners = [p for p in self.players if p.might_have_card(card)]
-            if len(possible_owners) == 1:
-                console.print(
-                    f"[yellow]Only {possible_owners[0].name} could have {card}![/]"
-                )
-                self.record_has_card(possible_owners[0], card)
+        # Inlined _possible_mask: unknown cards are never owned, so only the
+        # player's own masks need clearing
+        possibles = [unknown & ~(p.has_mask | p.not_mask) for p in self.players]
+        could_have, multi = _owner_masks(possibles)
+
+        unique = could_have & ~multi
+        for player, possible in zip(self.players, possibles):
+            owned = possible & unique
+            while owned:
+                bit = owned & -owned
+                owned ^= bit
+                card = self.possibilities.card_at(bit)
+                console.print(f"[yellow]Only {player.name} could have {card}![/]")
+                self.record_has_card(player, card)
                 changed = True
-            elif len(possible_owners) == 0:
-                # Nobody can have it - must be in solution
-                card_type = self.get_card_type(card)
-                # Only mark as solution if it's still a possibility
-                if card in self.solution_possibilities[card_type]:
-                    if len(self.solution_possibilities[card_type]) > 1:
-                        console.print(f"[yellow]{card} must be in the solution![/]")
-                        self.solution_possibilities[card_type] = {card}
-                        self.unknown_cards.discard(card)
-                        changed = True
+
+        nobody = unknown & ~could_have
+        while nobody:
+            bit = nobody & -nobody
+            nobody ^= bit
+            # Nobody can have it - must be in solution
+            card = self.possibilities.card_at(bit)
+            card_type = self.get_card_type(card)
+            # Only mark as solution if it's still a possibility
+            if card in self.solution_possibilities[card_type]:
+                if len(self.solution_possibilities[card_type]) > 1:
+                    console.print(f"[yellow]{card} must be in the solution![/]")
+                    self._record_solution(card_type, card)
+                    changed = True
         return changed
 
     def _deduce_solution_cards(self) -> bool:
@@ -336,13 +469,16 @@ class KnowledgeBase:
         If only one card remains possible for a solution slot, it's confirmed.
         Mark it as not-owned by any player (it's in the envelope).
         """
+        slots = self._dirty_slots
+        self._dirty_slots = set()
+
         changed = False
         for card_type, possible in self.solution_possibilities.items():
-            if len(possible) == 1:
+            if card_type in slots and len(possible) == 1:
                 solution_card = next(iter(possible))
                 for player in self.players:
-                    if player.might_have_card(solution_card):
-                        player.mark_not_card(solution_card)
+                    if self.might_have_card(player, solution_card):
+                        self.record_does_not_have(player, solution_card)
                         changed = True
 
         return changed
@@ -353,18 +489,31 @@ class KnowledgeBase:
         e.g. "player showed one of {A,B,C}". If we ruled out A and B, they must have C
 
         """
+        if not self._constraints_dirty:
+            return False
+        # Cleared up front; resolving a constraint below can dirty it again
+        self._constraints_dirty = False
+
         changed = False
         new_constraints = []
         for constraint in self.constraints:
-            narrowed = constraint.narrow()
+            owned = self._owned_mask
+            if (
+                constraint.player.version == constraint._cached_version
+                and constraint._cached_owned == owned
+            ):
+                # Nothing new known, can't narrow further
+                new_constraints.append(constraint)
+                continue
+            narrowed = constraint.narrow(owned)
 
             if narrowed.impossible:
                 console.print(
                     f"[red]Contradiction: {constraint.player.name} should have shown a card",
-                    f"from {constraint.possible_cards} but has none of them",
+                    f"from {self.possibilities.cards_of(constraint.possible_mask)} but has none of them",
                 )
             elif narrowed.resolved:
-                card = next(iter(narrowed.possible_cards))
+                card = self.possibilities.card_at(narrowed.possible_mask)
                 console.print(
                     f"[yellow]{constraint.player.name} must have {card} (only possibility left)![/]"
                 )
@@ -381,35 +530,39 @@ class KnowledgeBase:
         If a player has all their cards, mark all unknown cards as not-theirs.
         If a player needs exactly N more cards and there are exactly N unknowns they could have, they must have all N.
         """
-        changed = False
+        players = self._dirty_players
+        self._dirty_players = set()
 
+        changed = False
         for player in self.players:
+            if player not in players:
+                continue
+            # Unknown cards they could have (inlined as in _deduce_unique_owner)
+            possible_mask = self.unknown_mask & ~(player.has_mask | player.not_mask)
             if player.is_full:
                 # They can't have any more cards
-                for card in self.unknown_cards:
-                    if player.might_have_card(card):
-                        console.print(
-                            f"[yellow]{player.name}'s hand is full — can't have {card}[/]"
-                        )
-                        player.mark_not_card(card)
-                        changed = True
-            else:
-                # Count how many unknown cards they could have
-                possible = [c for c in self.unknown_cards if player.might_have_card(c)]
-                if len(possible) == player.cards_remaining:
-                    # They must have all of them
+                for card in self.possibilities.cards_of(possible_mask):
                     console.print(
-                        f"[yellow]{player.name} needs {player.cards_remaining} more cards "
-                        f"and can only have {possible} — must have all![/]"
+                        f"[yellow]{player.name}'s hand is full — can't have {card}[/]"
                     )
-                    for card in possible:
-                        self.record_has_card(player, card)
-                        changed = True
+                    self.record_does_not_have(player, card)
+                    changed = True
+            elif possible_mask.bit_count() == player.cards_remaining:
+                # They must have all of them
+                possible = self.possibilities.cards_of(possible_mask)
+                console.print(
+                    f"[yellow]{player.name} needs {player.cards_remaining} more cards "
+                    f"and can only have {possible} — must have all![/]"
+                )
+                for card in possible:
+                    self.record_has_card(player, card)
+                    changed = True
 
         return changed
 
     def get_unknown_cards(self) -> list[str]:
-        return sorted(self.unknown_cards)
+        """Unknown cards in configuration order, no sorting needed"""
+        return self.possibilities.cards_of(self.unknown_mask)
 
     @property
     def solution(self) -> dict[str, str | None]:
@@ -426,12 +579,17 @@ class KnowledgeBase:
 class HumanPlayer(Player):
     """The player sitting at the keyboard. Prompts are directed to them."""
 
+    __slots__ = ()
+
     def respond_to_suggestion(self, suggestion: Suggestion) -> str | None:
         """
         Ask the human which card they want to show (if any).
         Returns the card name, or None if they have nothing to show.
         """
-        overlapping = suggestion.cards & self.cards
+        # In configuration order, as in the status panel
+        overlapping = self.config.cards_of(
+            self.has_mask & self.config.mask_of(suggestion.cards)
+        )
         if not overlapping:
             console.print("[green]You have none of these cards.[/]")
             return None
@@ -440,14 +598,14 @@ class HumanPlayer(Player):
         if not Confirm.ask("Did you show a card?"):
             return None
 
-        return Prompt.ask(
-            prompt="Which card did you show?", choices=sorted(overlapping)
-        )
+        return Prompt.ask(prompt="Which card did you show?", choices=overlapping)
 
 
 class ObservedPlayer(Player):
     """A player being watched. The human observer is asked what they did."""
 
+    __slots__ = ()
+
     def respond_to_suggestion(self, suggestion: Suggestion) -> str | None:
         """
         Ask the human observer whether this player showed a card.
@@ -466,6 +624,8 @@ class CluedoSolver:
         self.num_players: int = 4
         self.your_player: HumanPlayer = HumanPlayer("_", 0, self.config, 1)
         self.kb: KnowledgeBase = KnowledgeBase([], STANDARD)
+        # _turn_order[i] is the other players in the order they answer player i
+        self._turn_order: list[list[Player]] = []
 
     def run(self):
         """Entry point — set up the game then loop through turns."""
@@ -473,8 +633,11 @@ class CluedoSolver:
         console.print("Loading Cluedo solver...")
         self._setup()
 
-        for i in itertools.cycle(range(self.num_players)):
+        n = self.num_players
+        i = 0
+        while True:
             self._take_turn(i)
+            i = i + 1 if i + 1 < n else 0
 
     def _setup(self):
         self.config = CluedoConfiguration.get_by_name(
@@ -506,6 +669,10 @@ class CluedoSolver:
 
         console.print(f"[bold green]Initialised {self.num_players} players![/]")
         self.kb = KnowledgeBase(self.players, self.config)
+        n = self.num_players
+        self._turn_order = [
+            [self.players[(i + 1 + k) % n] for k in range(n - 1)] for i in range(n)
+        ]
 
         console.line()
         console.print(f"[yellow]You should have {cards_each} cards in your hand.[/]")
@@ -515,12 +682,13 @@ class CluedoSolver:
             )
         console.line()
 
+        # Cards not entered yet, shrinks as each card is picked
+        available_cards = list(self.config.cards)
+
         # Enter your hand
         for i in range(cards_each):
-            available_cards = [
-                c for c in self.config.cards if c not in self.your_player.cards
-            ]
             card = Prompt.ask(f"Enter your card {i + 1}", choices=available_cards)
+            available_cards.remove(card)
             self.kb.record_has_card(self.your_player, card)
 
         # Enter bonus cards (visible to everyone)
@@ -528,13 +696,11 @@ class CluedoSolver:
             console.line()
             console.print(f"[bold yellow]Now enter the {bonus} face-up bonus cards:[/]")
             for i in range(bonus):
-                available_cards = [
-                    c for c in self.config.cards if c not in self.your_player.cards
-                ]
                 card = Prompt.ask(f"Enter bonus card {i + 1}", choices=available_cards)
+                available_cards.remove(card)
 
                 # Remove from unknowns
-                self.kb.unknown_cards.discard(card)
+                self.kb.unknown_mask &= ~self.config.card_bits[card]
 
                 # Remove from solution possibilities
                 card_type = self.kb.get_card_type(card)
@@ -546,7 +712,7 @@ class CluedoSolver:
 
         console.line()
         console.print(
-            f"[bold green]Setup complete! Your hand: {sorted(self.your_player.cards)}[/]"
+            f"[bold green]Setup complete! Your hand: {self.config.cards_of(self.your_player.has_mask)}[/]"
         )
 
     def _take_turn(self, player_index: int):
@@ -559,7 +725,7 @@ class CluedoSolver:
         showing_player = None
         shown_card = None
 
-        for answering_player in self._players_after(player_index):
+        for answering_player in self._turn_order[player_index]:
             result = answering_player.respond_to_suggestion(suggestion)
             if result is None:
                 for card in suggestion.cards:
@@ -596,24 +762,22 @@ class CluedoSolver:
         )
         return Suggestion(suspect, weapon, location)
 
-    def _players_after(self, starting_index: int):
-        """Yield players in turn order after the starting player"""
-        for i in range(self.num_players - 1):
-            yield self.players[(starting_index + 1 + i) % self.num_players]
-
     def _print_status(self):
         text = ""
-        text += f"\n[yellow]Unknown cards ({len(self.kb.unknown_cards)}):[/] {self.kb.get_unknown_cards()}"
+        text += f"\n[yellow]Unknown cards ({self.kb.unknown_mask.bit_count()}):[/] {self.kb.get_unknown_cards()}"
         text += "\nSolution Possibilities:"
 
+        # Cards are listed in configuration order
+        order = self.config.card_index.__getitem__
         for card_type in ["suspect", "weapon", "location"]:
-            possible = sorted(self.kb.solution_possibilities[card_type])
+            possible = sorted(self.kb.solution_possibilities[card_type], key=order)
             text += f"\n{card_type.capitalize()}: {possible}"
 
         if self.kb.constraints:
             text += "\nPending Constraints:"
             for c in self.kb.constraints:
-                text += f"\n{c.player.name} has one of: {sorted(c.possible_cards)}"
+                possible = self.config.cards_of(c.possible_mask)
+                text += f"\n{c.player.name} has one of: {possible}"
 
         solution = self.kb.solution
         if self.kb.is_solved:
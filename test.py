@@ -1,28 +1,28 @@
-from rich.console import Console
 from rich.live import Live
 from rich.layout import Layout
 from rich.panel import Panel
-from io import StringIO
+from collections import deque
 import time
 
-# Create layout
-layout = Layout()
-layout.split_row(Layout(name="main"), Layout(name="sidebar", size=30))
+if __name__ == "__main__":
+    # Create layout
+    layout = Layout()
+    layout.split_row(Layout(name="main"), Layout(name="sidebar", size=30))
 
-# Create a console that writes to a StringIO buffer
-buffer = StringIO()
-console = Console(file=buffer, force_terminal=True)
+    # Only the most recent lines are kept, so each redraw stays the same size
+    lines = deque(maxlen=50)
 
-with Live(layout, refresh_per_second=10):
-    for i in range(20):
-        # Print to the console (goes to buffer)
-        console.print(f"[green]Processing item {i}")
-        console.print(f"Status: OK")
+    # Redraw only when the layout changes rather than on a timer
+    with Live(layout, auto_refresh=False) as live:
+        for i in range(20):
+            lines.append(f"[green]Processing item {i}[/]")
+            lines.append("Status: OK")
 
-        # Update the main layout with buffer contents
-        layout["main"].update(Panel(buffer.getvalue(), title="Output"))
+            # Update the main layout with the recent lines
+            layout["main"].update(Panel("\n".join(lines), title="Output"))
 
-        # Update sidebar independently
-        layout["sidebar"].update(Panel(f"Count: {i}", title="Stats"))
+            # Update sidebar independently
+            layout["sidebar"].update(Panel(f"Count: {i}", title="Stats"))
 
-        time.sleep(0.3)
+            live.refresh()
+            time.sleep(0.3)